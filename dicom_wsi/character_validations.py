@@ -10,44 +10,54 @@ DT_LIST = ['DT']
 DS_LIST = ['DS']
 CS_LIST = ['CS']
 
+# Allowed characters for each VR, compiled once so each check is a single scan
+CS_RE = re.compile('[a-zA-Z _]*')
+INT_RE = re.compile('[0-9]*')
+SIGNEDINT_RE = re.compile('[0-9-]*')
+TIME_RE = re.compile('[0-9 .]*')
+UI_RE = re.compile('[0-9.]*')
+DT_RE = re.compile('[0-9+-. ]*')
+DS_RE = re.compile('[0-9+-eE]*')
+INTSTRING_RE = re.compile('[0-9+-]*')
+
 
 def cs_validator(key, value):
-    assert re.sub('[a-zA-Z _]', '', value).__len__() == 0, \
+    assert CS_RE.fullmatch(value), \
         "{} must only contain a-z, A-Z, space, or _, but your provided {}".format(key, value)
 
 
 def int_validator(key, value):
-    assert re.sub('[0-9]', '', str(value)).__len__() == 0, \
+    assert INT_RE.fullmatch(str(value)), \
         "{} must only contain 0-9, but your provided {}".format(key, value)
 
 
 # noinspection SpellCheckingInspection
 def signedint_validator(key, value):
-    assert re.sub('[0-9-]', '', str(value)).__len__() == 0, \
+    assert SIGNEDINT_RE.fullmatch(str(value)), \
         "{} must only contain 0-9 and -, but your provided {}".format(key, value)
 
 
 def time_validator(key, value):
-    assert re.sub('[0-9 .]', '', str(value)).__len__() == 0, \
+    assert TIME_RE.fullmatch(str(value)), \
         "{} must only contain 0-9, space and ., but your provided {}".format(key, value)
 
 
 def ui_validator(key, value):
-    assert re.sub('[0-9.]', '', str(value)).__len__() == 0, \
+    assert UI_RE.fullmatch(str(value)), \
         "{} must only contain 0-9 and ., but your provided {}".format(key, value)
 
 
 def dt_validator(key, value):
-    assert re.sub('[0-9+-. ]', '', str(value)).__len__() == 0, \
+    assert DT_RE.fullmatch(str(value)), \
         "{} must only contain 0-9, +, -, space, and ., but your provided {}".format(key, value)
 
 
 def ds_validator(key, value):
-    assert re.sub('[0-9+-eE]', '', str(value)).__len__() == 0, \
+    assert DS_RE.fullmatch(str(value)), \
         "{} must only contain 0-9, +, -, e, and E, but your provided {}".format(key, value)
 
 
 # noinspection SpellCheckingInspection
 def intstring_validator(key, value):
-    assert re.sub('[0-9+-]', '', str(value)).__len__() == 0, \
+    assert INTSTRING_RE.fullmatch(str(value)), \
         "{} must only contain 0-9, +, and - but your provided {}".format(key, value)
@@ -6,7 +6,6 @@ import logging
 import os
 import sys
 
-from . import parse_wsi
 from yaml import load, BaseLoader
 
 import dicom_wsi
@@ -42,6 +41,7 @@ def main():
 
     parser.add_argument("-P", "--pools",
                         dest='pools',
+                        type=int,
                         default=-1,
                         help="How many CPUs to use (default=all")
 
@@ -58,7 +58,6 @@ def main():
     logger = logging.getLogger(__name__)
     logger.setLevel(args.logLevel)
     cfg = load(open(args.yaml), Loader=BaseLoader)
-    cfg, wsi = parse_wsi.get_wsi(cfg)
 
     if args.wsi:
         cfg['General']['WSIFile'] = args.wsi
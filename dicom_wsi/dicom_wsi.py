@@ -22,12 +22,13 @@ def create_dicom(cfg, pools=-1):
     logger.info('All inputs are valid')
     number_of_levels = int(cfg.get('General').get('NumberOfLevels'))
 
+    pools = int(pools)
     if pools < 0:
-        pool = mp.Pool(mp.cpu_count())
-        logger.debug(f'Using {mp.cpu_count()} CPUs')
-    else:
-        pool = mp.Pool(pools)
-        logger.debug(f'Using {pools} CPUs')
+        pools = mp.cpu_count()
+    # There is never more work than one instance per level, so extra workers would only sit idle
+    pools = max(1, min(pools, number_of_levels))
+    logger.debug(f'Using {pools} CPUs')
 
-    results = pool.starmap(run_instance, [(i, cfg) for i in reversed(range(number_of_levels))])
-    pool.close()
+    with mp.Pool(pools) as pool:
+        results = pool.starmap(run_instance, [(i, cfg) for i in reversed(range(number_of_levels))])
+    return 0
@@ -8,7 +8,9 @@ import pydicom
 def extract_ann_dicom(dicom_file):
     '''Pydicom help:https://pydicom.github.io/pydicom/stable/old/getting_started.html'''
     '''Pydicom object from input dicome file'''
-    ds = pydicom.dcmread(dicom_file)
+    '''Annotations live in the header, so skip reading the (potentially huge) pixel data'''
+    '''and only parse the one element we use instead of the whole per-frame functional groups'''
+    ds = pydicom.dcmread(dicom_file, stop_before_pixels=True, specific_tags=['GraphicAnnotationSequence'])
 
     '''Explore dicom object iteratively'''
     #ds.GraphicAnnotationSequence[0].ReferencedImageSequence[0].GraphicObjectSequence[0].dir()
@@ -132,8 +132,9 @@ def _validate(module, sample_dict):
         return 0
 
     # Check to make sure an entry exists for all required fields
+    provided_key_set = set(provided_keys)
     for k in required_keys:
-        assert k in provided_keys, 'You are missing the sample field for {} \nin {} \nbut you provided {}'. \
+        assert k in provided_key_set, 'You are missing the sample field for {} \nin {} \nbut you provided {}'. \
             format(k, required_keys, provided_keys)
 
     _validation_wrapper(provided_keys, sample_dict)
@@ -50,6 +50,9 @@ def add_per_frame_functional_groups_sequence(img=None, ds=None, cfg=None, tile_s
     ds.TotalPixelMatrixColumns, ds.TotalPixelMatrixRows = img.width, img.height
     ds.PerFrameFunctionalGroupsSequence = Sequence([])
 
+    # The slide origin and pixel spacing are the same for every frame, so only look them up once
+    geometry = get_slide_geometry(ds)
+
     tiles = generate_xy_tiles(ds.TotalPixelMatrixColumns, ds.TotalPixelMatrixRows, tile_size=tile_size)
     for i in tiles:
         x_pos, y_pos, x_tile, y_tile = i
@@ -59,7 +62,8 @@ def add_per_frame_functional_groups_sequence(img=None, ds=None, cfg=None, tile_s
         y_tile = int(y_tile)
 
         x, y, z = compute_slide_offsets_from_pixel_data(ds=ds, row=y_tile, col=x_tile,
-                                                        series_downsample=series_downsample)
+                                                        series_downsample=series_downsample,
+                                                        geometry=geometry)
 
         # Get pixel data for the frame
         x_next_step = tile_size + x_pos
@@ -70,7 +74,7 @@ def add_per_frame_functional_groups_sequence(img=None, ds=None, cfg=None, tile_s
         if tiled_sparse == 'TILED_SPARSE':
             if not image_filter(tmp, background_range=background_range, threshold=threshold):
                 # Skip to avoid background tiles
-                logger.debug('Skipping {} {}'.format(x_pos, y_pos))
+                logger.debug('Skipping %s %s', x_pos, y_pos)
                 continue
 
         # Make sure the frame is square and filled
@@ -91,11 +95,13 @@ def add_per_frame_functional_groups_sequence(img=None, ds=None, cfg=None, tile_s
             imlist = []
             ds.PerFrameFunctionalGroupsSequence = None
 
-    ds = add_imgdata(imlist, ds, tile_size, compression_type, compression_quality)
-    out_file = out_file_prefix + '.' + str(ds.InstanceNumber) + '-' + str(fragment) + '.dcm'
+    # Nothing left over if the frames divided evenly into MaxFrames or every tile was background
+    if imlist:
+        ds = add_imgdata(imlist, ds, tile_size, compression_type, compression_quality)
+        out_file = out_file_prefix + '.' + str(ds.InstanceNumber) + '-' + str(fragment) + '.dcm'
 
-    dcmwrite(out_file, ds, write_like_original=False)
-    logger.info('Compressed {} image frames into {}'.format(imlist.__len__(), out_file))
+        dcmwrite(out_file, ds, write_like_original=False)
+        logger.info('Compressed {} image frames into {}'.format(imlist.__len__(), out_file))
     return 1
 
 
@@ -112,13 +118,12 @@ def add_imgdata(imlist, ds, tile_size, compression_type, compression_quality):
     """
     num_frames = imlist.__len__()
     ds.NumberOfFrames = int(num_frames)
-    image_array = np.zeros((num_frames, tile_size, tile_size, 3), dtype=np.uint8)
-
-    # stack each of the frames
-    for q in range(num_frames):
-        image_array[q, :, :, :] = imlist[q]
 
     if compression_type == 'None':
+        # stack each of the frames (only needed for uncompressed output, the compressors work per frame)
+        image_array = np.zeros((num_frames, tile_size, tile_size, 3), dtype=np.uint8)
+        for q in range(num_frames):
+            image_array[q, :, :, :] = imlist[q]
         ds.PixelData = image_array.tobytes()
         ds.LossyImageCompression = '00'
     else:
@@ -176,11 +181,25 @@ def generate_xy_tiles(x_max, y_max, tile_size=500):
         y_tile = 0
         for y in range(1, int(y_max), tile_size):
             y_tile += 1
-            logging.debug('x:{} y:{} x_tile:{} y_tile:{}'.format(x, y, x_tile, y_tile))
+            logger.debug('x:%s y:%s x_tile:%s y_tile:%s', x, y, x_tile, y_tile)
             yield x, y, x_tile, y_tile
 
 
-def compute_slide_offsets_from_pixel_data(ds=None, row=None, col=None, series_downsample=1):
+def get_slide_geometry(ds):
+    """
+    Look up the slide origin and pixel spacing needed to place frames in slide space
+
+    :param ds: some sort of DICOM object
+    :return: x origin (0040,072a), y origin (0040,073a), and the row and column spacing,
+        in Pixel Spacing (0028,0030) order
+    """
+    origin = ds.TotalPixelMatrixOriginSequence[0]
+    pixel_spacing = ds.SharedFunctionalGroupsSequence[0][0x0028, 0x9110][0][0x0028, 0x0030]
+    return (int(origin[0x0040, 0x0072a].value), int(origin[0x0040, 0x0073a].value),
+            float(pixel_spacing[0]), float(pixel_spacing[1]))
+
+
+def compute_slide_offsets_from_pixel_data(ds=None, row=None, col=None, series_downsample=1, geometry=None):
     """
     Calculate the x and y coordinate in slide space
 
@@ -188,16 +207,19 @@ def compute_slide_offsets_from_pixel_data(ds=None, row=None, col=None, series_do
     :param row: tile row number [Dimension Index Values (0020,9157)]
     :param col: tile column number [Dimension Index Values (0020,9157)]
     :param series_downsample: number that indicates how many divisions to apply (1 means no downsample, i.e. level 0)
+    :param geometry: output of get_slide_geometry, to avoid looking it up again for every frame
     :return: x (0040,072a), y (0040,073a), and z (0040,074a) offsets
     """
     assert ds is not None, "You must provide a valid DICOM object"
     assert row is not None, "Row value should not be empty"
     assert col is not None, "Col value should not be empty"
+    if geometry is None:
+        geometry = get_slide_geometry(ds)
+    x_origin, y_origin, row_spacing, col_spacing = geometry
     # BeginningPosition - RocOrColNumber * PixelSpacing * series_downsample
-    x = int(ds.TotalPixelMatrixOriginSequence[0][0x0040, 0x0072a].value) - (
-        row * float(ds.SharedFunctionalGroupsSequence[0][0x0028, 0x9110][0][0x0028, 0x0030][1]) * series_downsample)
-    y = int(ds.TotalPixelMatrixOriginSequence[0][0x0040, 0x0073a].value) - (
-        col * float(ds.SharedFunctionalGroupsSequence[0][0x0028, 0x9110][0][0x0028, 0x0030][0]) * series_downsample)
+    # Note the row number is scaled by the column spacing and vice versa
+    x = x_origin - (row * col_spacing * series_downsample)
+    y = y_origin - (col * row_spacing * series_downsample)
     z = 0
     return x, y, z
 
@@ -222,13 +244,7 @@ def ensure_even_image(tmp, tile_size):
     return tmp_img
 
 
-# TODO: Make this faster!!!
 def compress_img_list(ds, imlist, num_frames, compression_type, compression_quality):
-    f = io.BytesIO()
-    imlist[0].save(f, format='tiff', append_images=imlist[1:], save_all=True, compression='None')
-    # The BytesIO object cursor is at the end of the object, so I need to tell it to go back to the front
-    f.seek(0)
-    img = Image.open(f)
     img_byte_list = []
     # Get each one of the frames converted to even numbered bytes
 
@@ -239,15 +255,11 @@ def compress_img_list(ds, imlist, num_frames, compression_type, compression_qual
         compression_type = 'JPEG2000'
         compression_method = 'ISO_15444_1'
 
-    for i in range(num_frames):
-        try:
-            img.seek(i)
-            with io.BytesIO() as output:
-                img.save(output, format=compression_type, quality=compression_quality)
-                img_byte_list.append(output.getvalue())
-        except EOFError:
-            # Not enough frames in img
-            break
+    # Encode each frame directly rather than stacking them into a multi-page TIFF and reading it back
+    for img in imlist:
+        with io.BytesIO() as output:
+            img.save(output, format=compression_type, quality=compression_quality)
+            img_byte_list.append(output.getvalue())
 
     ds.PixelData = encapsulate(img_byte_list)
     ds['PixelData'].is_undefined_length = True
@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `dicom_wsi` package."""
+import pytest
+
+from ..dicom_wsi import dicom_wsi
+
+
+class FakePool:
+    """Stands in for multiprocessing.Pool so no slide is ever converted"""
+    processes = []
+
+    def __init__(self, processes):
+        FakePool.processes.append(processes)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def starmap(self, func, iterable):
+        return []
+
+
+@pytest.mark.parametrize('pools, expected', [
+    ('4', 4),
+    (-1, 7),
+    (0, 1),
+    (3, 3),
+    (50, 7),
+])
+def test_create_dicom_pool_size(monkeypatch, pools, expected):
+    FakePool.processes = []
+    monkeypatch.setattr(dicom_wsi, 'validate_cfg', lambda cfg: None)
+    monkeypatch.setattr(dicom_wsi.mp, 'Pool', FakePool)
+    monkeypatch.setattr(dicom_wsi.mp, 'cpu_count', lambda: 16)
+    cfg = {'General': {'NumberOfLevels': '7'}}
+
+    assert dicom_wsi.create_dicom(cfg, pools=pools) == 0
+    assert FakePool.processes == [expected]
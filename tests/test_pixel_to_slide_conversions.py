@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `dicom_wsi` package."""
+import pytest
+from pydicom.dataset import Dataset
+from pydicom.sequence import Sequence
+
+from ..dicom_wsi.pixel_to_slide_conversions import compute_slide_offsets_from_pixel_data, get_slide_geometry
+
+
+def build_geometry_dataset():
+    ds = Dataset()
+    origin = Dataset()
+    origin.XOffsetInSlideCoordinateSystem = 100
+    origin.YOffsetInSlideCoordinateSystem = 200
+    ds.TotalPixelMatrixOriginSequence = Sequence([origin])
+
+    pixel_measures = Dataset()
+    pixel_measures.PixelSpacing = [0.25, 0.3]
+    shared = Dataset()
+    shared.PixelMeasuresSequence = Sequence([pixel_measures])
+    ds.SharedFunctionalGroupsSequence = Sequence([shared])
+    return ds
+
+
+def test_get_slide_geometry():
+    ds = build_geometry_dataset()
+    assert get_slide_geometry(ds) == (100, 200, 0.25, 0.3)
+
+
+def test_compute_slide_offsets_with_geometry():
+    ds = build_geometry_dataset()
+    geometry = get_slide_geometry(ds)
+    for row, col, series_downsample in [(2, 3, 1), (7, 1, 4)]:
+        expected = compute_slide_offsets_from_pixel_data(ds=ds, row=row, col=col,
+                                                         series_downsample=series_downsample)
+        returned = compute_slide_offsets_from_pixel_data(ds=ds, row=row, col=col,
+                                                         series_downsample=series_downsample,
+                                                         geometry=geometry)
+        assert returned == expected
+
+    x, y, z = compute_slide_offsets_from_pixel_data(ds=ds, row=2, col=3, geometry=geometry)
+    assert x == pytest.approx(100 - 2 * 0.3)
+    assert y == pytest.approx(200 - 3 * 0.25)
+    assert z == 0